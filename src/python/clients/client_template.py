@@ -3,6 +3,8 @@ Client Quantum Template - Generic client integration
 Template for client-specific quantum implementations
 """
 
+from datetime import datetime
+
 class ClientQuantumTemplate:
     """Template for client quantum implementations"""
     
@@ -52,7 +54,7 @@ class ClientQuantumTemplate:
             'circuit_depth': circuit.depth(),
             'gate_count': sum(circuit.count_ops().values()),
             'data_processed': len(data),
-            'timestamp': __import__('datetime').datetime.now().isoformat()
+            'timestamp': datetime.now().isoformat()
         }
 
 if __name__ == "__main__":
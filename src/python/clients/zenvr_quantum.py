@@ -4,15 +4,24 @@ Specialized quantum operations for child development analytics
 """
 
 import numpy as np
-from qiskit import QuantumCircuit, execute, Aer
+from qiskit import QuantumCircuit
 import pennylane as qml
 
 class ZENVRQuantum:
     """Zius Global specialized quantum operations"""
     
     def __init__(self):
-        self.backend = Aer.get_backend('qasm_simulator')
         self.num_qubits = 4
+        self._feature_map = None
+        
+    @staticmethod
+    def _quantum_feature_map(x):
+        """Angle-encode features and entangle neighbouring wires"""
+        for i in range(len(x)):
+            qml.RY(x[i] * np.pi, wires=i)
+        for i in range(len(x)-1):
+            qml.CNOT(wires=[i, i+1])
+        return qml.state()
         
     def behavioral_pattern_circuit(self, behavioral_data):
         """
@@ -50,18 +59,12 @@ class ZENVRQuantum:
             metrics.get('focus_duration', 0.5)
         ]
         
-        # Create quantum feature map
-        dev = qml.device('default.qubit', wires=len(features))
-        
-        @qml.qnode(dev)
-        def quantum_feature_map(x):
-            for i in range(len(x)):
-                qml.RY(x[i] * np.pi, wires=i)
-            for i in range(len(x)-1):
-                qml.CNOT(wires=[i, i+1])
-            return qml.state()
+        # Device and QNode are built on first use and reused afterwards
+        if self._feature_map is None:
+            dev = qml.device('lightning.qubit', wires=self.num_qubits)
+            self._feature_map = qml.qnode(dev)(self._quantum_feature_map)
         
-        quantum_features = quantum_feature_map(features)
+        quantum_features = self._feature_map(features)
         
         # Simple classification based on quantum state
         avg_amplitude = np.mean(np.abs(quantum_features))
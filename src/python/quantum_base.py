@@ -6,10 +6,6 @@ Core quantum computing operations and utilities
 import numpy as np
 import qiskit as qk
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from qiskit.visualization import plot_histogram
-import pennylane as qml
-import tensorflow as tf
-import torch
 
 class QuantumBase:
     """Base class for quantum operations"""
@@ -39,6 +35,7 @@ class QuantumBase:
     
     def variational_quantum_circuit(self, params):
         """Create variational quantum circuit"""
+        import pennylane as qml
         dev = qml.device('default.qubit', wires=self.num_qubits)
         
         @qml.qnode(dev)
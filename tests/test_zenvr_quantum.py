@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+qml = pytest.importorskip("pennylane")
+pytest.importorskip("qiskit")
+
+from src.python.clients.zenvr_quantum import ZENVRQuantum
+
+
+def test_predict_emotional_state_matches_default_qubit():
+    metrics = {
+        'sleep_quality': 0.8,
+        'activity_level': 0.7,
+        'social_interaction': 0.9,
+        'focus_duration': 0.6
+    }
+    features = [0.8, 0.7, 0.9, 0.6]
+    dev = qml.device('default.qubit', wires=len(features))
+
+    @qml.qnode(dev)
+    def quantum_feature_map(x):
+        for i in range(len(x)):
+            qml.RY(x[i] * np.pi, wires=i)
+        for i in range(len(x)-1):
+            qml.CNOT(wires=[i, i+1])
+        return qml.state()
+
+    expected_state = quantum_feature_map(features)
+    avg_amplitude = np.mean(np.abs(expected_state))
+    if avg_amplitude > 0.7:
+        expected_label = "Stable"
+    elif avg_amplitude > 0.4:
+        expected_label = "Moderate"
+    else:
+        expected_label = "Unstable"
+
+    zenvr_q = ZENVRQuantum()
+    label, state = zenvr_q.predict_emotional_state(metrics)
+
+    assert label == expected_label
+    assert np.allclose(state, expected_state)